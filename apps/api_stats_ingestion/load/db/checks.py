@@ -1,9 +1,32 @@
-"""Database check functions to verify existing records before insertion."""
+"""
+Database check functions to verify existing records before insertion.
+
+Index usage (see sql/*.sql):
+- match_history lookups use the match_id primary key.
+- player_match_stats, player_kill_stats and player_death_stats lookups use the
+  (player_id, match_id) primary key, so each probe is an index scan on that
+  key and no extra composite index is needed.
+- player_victim/player_nemesis lookups (insert_opponents.py) use the
+  (player_id, match_id, victim_name/nemesis_name) primary keys.
+"""
 
 import asyncpg
 
 from typing import List, Tuple
 
+# Shared (player_id, match_id) existence query; formatted once per table at import
+_EXISTING_PLAYER_MATCH_QUERY_TEMPLATE = """
+    SELECT player_id, match_id 
+    FROM pathfinder_stats.{table} 
+    WHERE player_id = ANY($1::text[]) AND match_id = ANY($2::int[])
+"""
+
+_PLAYER_MATCH_STATS_EXISTING_QUERY = _EXISTING_PLAYER_MATCH_QUERY_TEMPLATE.format(table="player_match_stats")
+_PLAYER_KILL_STATS_EXISTING_QUERY = _EXISTING_PLAYER_MATCH_QUERY_TEMPLATE.format(table="player_kill_stats")
+_PLAYER_DEATH_STATS_EXISTING_QUERY = _EXISTING_PLAYER_MATCH_QUERY_TEMPLATE.format(table="player_death_stats")
+_PLAYER_VICTIM_EXISTING_QUERY = _EXISTING_PLAYER_MATCH_QUERY_TEMPLATE.format(table="player_victim")
+_PLAYER_NEMESIS_EXISTING_QUERY = _EXISTING_PLAYER_MATCH_QUERY_TEMPLATE.format(table="player_nemesis")
+
 
 async def check_existing_match_ids(
     conn: asyncpg.Connection,
@@ -20,44 +43,37 @@ async def check_existing_match_ids(
     return {row["match_id"] for row in rows}
 
 
-async def check_existing_player_match_ids(
+async def _check_existing_player_match_keys(
     conn: asyncpg.Connection,
+    query: str,
     player_match_keys: List[Tuple[str, int]],
 ) -> set[Tuple[str, int]]:
-    """Check which (player_id, match_id) combinations already exist in player_match_stats."""
+    """Run a (player_id, match_id) existence query and return the matching keys."""
     if not player_match_keys:
         return set()
     
     player_ids = [key[0] for key in player_match_keys]
     match_ids = [key[1] for key in player_match_keys]
     
-    rows = await conn.fetch("""
-        SELECT player_id, match_id 
-        FROM pathfinder_stats.player_match_stats 
-        WHERE player_id = ANY($1::text[]) AND match_id = ANY($2::int[])
-    """, player_ids, match_ids)
+    rows = await conn.fetch(query, player_ids, match_ids)
     
     return {(row["player_id"], row["match_id"]) for row in rows}
 
 
+async def check_existing_player_match_ids(
+    conn: asyncpg.Connection,
+    player_match_keys: List[Tuple[str, int]],
+) -> set[Tuple[str, int]]:
+    """Check which (player_id, match_id) combinations already exist in player_match_stats."""
+    return await _check_existing_player_match_keys(conn, _PLAYER_MATCH_STATS_EXISTING_QUERY, player_match_keys)
+
+
 async def check_existing_player_kill_ids(
     conn: asyncpg.Connection,
     player_match_keys: List[Tuple[str, int]],
 ) -> set[Tuple[str, int]]:
     """Check which (player_id, match_id) combinations already exist in player_kill_stats."""
-    if not player_match_keys:
-        return set()
-    
-    player_ids = [key[0] for key in player_match_keys]
-    match_ids = [key[1] for key in player_match_keys]
-    
-    rows = await conn.fetch("""
-        SELECT player_id, match_id 
-        FROM pathfinder_stats.player_kill_stats 
-        WHERE player_id = ANY($1::text[]) AND match_id = ANY($2::int[])
-    """, player_ids, match_ids)
-    
-    return {(row["player_id"], row["match_id"]) for row in rows}
+    return await _check_existing_player_match_keys(conn, _PLAYER_KILL_STATS_EXISTING_QUERY, player_match_keys)
 
 
 async def check_existing_player_death_ids(
@@ -65,19 +81,7 @@ async def check_existing_player_death_ids(
     player_match_keys: List[Tuple[str, int]],
 ) -> set[Tuple[str, int]]:
     """Check which (player_id, match_id) combinations already exist in player_death_stats."""
-    if not player_match_keys:
-        return set()
-    
-    player_ids = [key[0] for key in player_match_keys]
-    match_ids = [key[1] for key in player_match_keys]
-    
-    rows = await conn.fetch("""
-        SELECT player_id, match_id 
-        FROM pathfinder_stats.player_death_stats 
-        WHERE player_id = ANY($1::text[]) AND match_id = ANY($2::int[])
-    """, player_ids, match_ids)
-    
-    return {(row["player_id"], row["match_id"]) for row in rows}
+    return await _check_existing_player_match_keys(conn, _PLAYER_DEATH_STATS_EXISTING_QUERY, player_match_keys)
 
 
 async def check_existing_player_victim_ids(
@@ -85,19 +89,7 @@ async def check_existing_player_victim_ids(
     player_match_keys: List[Tuple[str, int]],
 ) -> set[Tuple[str, int]]:
     """Check which (player_id, match_id) combinations already exist in player_victim."""
-    if not player_match_keys:
-        return set()
-    
-    player_ids = [key[0] for key in player_match_keys]
-    match_ids = [key[1] for key in player_match_keys]
-    
-    rows = await conn.fetch("""
-        SELECT player_id, match_id 
-        FROM pathfinder_stats.player_victim 
-        WHERE player_id = ANY($1::text[]) AND match_id = ANY($2::int[])
-    """, player_ids, match_ids)
-    
-    return {(row["player_id"], row["match_id"]) for row in rows}
+    return await _check_existing_player_match_keys(conn, _PLAYER_VICTIM_EXISTING_QUERY, player_match_keys)
 
 
 async def check_existing_player_nemesis_ids(
@@ -105,16 +97,4 @@ async def check_existing_player_nemesis_ids(
     player_match_keys: List[Tuple[str, int]],
 ) -> set[Tuple[str, int]]:
     """Check which (player_id, match_id) combinations already exist in player_nemesis."""
-    if not player_match_keys:
-        return set()
-    
-    player_ids = [key[0] for key in player_match_keys]
-    match_ids = [key[1] for key in player_match_keys]
-    
-    rows = await conn.fetch("""
-        SELECT player_id, match_id 
-        FROM pathfinder_stats.player_nemesis 
-        WHERE player_id = ANY($1::text[]) AND match_id = ANY($2::int[])
-    """, player_ids, match_ids)
-    
-    return {(row["player_id"], row["match_id"]) for row in rows}
+    return await _check_existing_player_match_keys(conn, _PLAYER_NEMESIS_EXISTING_QUERY, player_match_keys)
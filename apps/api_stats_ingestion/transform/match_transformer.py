@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import gc
 import os
+import re
+import threading
 
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional
@@ -21,8 +23,10 @@ try:
     # orjson.loads returns dict directly, but we need to handle bytes
     _original_loads = json.loads
     json.loads = lambda s: _original_loads(s.encode() if isinstance(s, str) else s)
+    _LOADS_ACCEPTS_MEMORYVIEW = True
 except ImportError:
     import json
+    _LOADS_ACCEPTS_MEMORYVIEW = False
 
 from apps.api_stats_ingestion.transform.transform_utils import (
     calculate_duration,
@@ -36,6 +40,44 @@ DATA_DIR = Path(os.getenv("API_INGESTION_DATA_DIR", str(ROOT_DIR)))
 SOURCE_FILE = DATA_DIR / "all_matches.json"
 MATCH_RESULTS_DIR = DATA_DIR / "match_results"
 
+# Match result files are saved by fetch/match_history.py as `<id>-<mapid>.json`,
+# so the match ID can be read from the filename without parsing the file.
+FILENAME_MATCH_ID_RE = re.compile(r"^(\d+)-")
+
+# Initial size of the per-thread read buffer; grows to the largest file seen
+READ_BUFFER_INITIAL_SIZE = 1 << 20
+_read_buffer = threading.local()
+
+
+def _load_json_file(file_path: Path) -> Any:
+    """
+    Read and parse a JSON file using a reusable per-thread buffer.
+    
+    Avoids allocating a fresh bytes object for every file when scanning
+    thousands of small match result files.
+    """
+    buffer = getattr(_read_buffer, "buffer", None)
+    
+    with open(file_path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if buffer is None or size > len(buffer):
+            # Replace rather than extend: a bytearray cannot be resized while views exist
+            buffer = bytearray(max(size, READ_BUFFER_INITIAL_SIZE))
+            _read_buffer.buffer = buffer
+        
+        view = memoryview(buffer)
+        bytes_read = 0
+        while bytes_read < size:
+            chunk_size = f.readinto(view[bytes_read:size])
+            if not chunk_size:
+                break
+            bytes_read += chunk_size
+    
+    with view[:bytes_read] as content:
+        if _LOADS_ACCEPTS_MEMORYVIEW:
+            return json.loads(content)
+        return json.loads(bytes(content))
+
 
 def transform_match_history_data() -> List[Dict[str, Any]]:
     """
@@ -63,7 +105,8 @@ def transform_match_history_data() -> List[Dict[str, Any]]:
         raise FileNotFoundError(f"Source file not found: {SOURCE_FILE}")
     
     # Read and parse JSON
-    file_content = SOURCE_FILE.read_text(encoding="utf-8")
+    # Read as bytes: orjson parses UTF-8 bytes directly, skipping a decode/encode round trip
+    file_content = SOURCE_FILE.read_bytes()
     data = json.loads(file_content)
     result = data.get("result") or {}
     maps = result.get("maps") or []
@@ -87,63 +130,12 @@ def transform_match_history_data() -> List[Dict[str, Any]]:
         if idx % PROGRESS_INTERVAL == 0:
             print(f"  Processed {idx}/{total_maps} entries ({len(transformed_matches)} transformed, {skipped_count} skipped)")
         
-        # Extract match ID
-        match_id = entry.get("id")
-        if match_id is None:
+        transformed_match = _extract_match_history_data(entry)
+        if transformed_match is None:
             skipped_count += 1
             continue
         
-        # Extract map information
-        map_info = entry.get("map") or {}
-        map_id = map_info.get("id")
-        if map_id is None:
-            skipped_count += 1
-            continue
-        
-        map_map_info = map_info.get("map") or {}
-        map_name = map_map_info.get("pretty_name")
-        map_short_name = map_map_info.get("shortname")
-        game_mode = map_info.get("game_mode")
-        environment = map_info.get("environment")
-        
-        # Extract result information
-        result_info = entry.get("result") or {}
-        allies_score = result_info.get("allied", 0)
-        axis_score = result_info.get("axis", 0)
-        
-        # Extract timestamps
-        start_str = entry.get("start")
-        end_str = entry.get("end")
-        
-        if not all([map_name, map_short_name, game_mode, environment, start_str, end_str]):
-            skipped_count += 1
-            continue
-        
-        try:
-            start_time = parse_timestamp(start_str)
-            end_time = parse_timestamp(end_str)
-        except (ValueError, TypeError):
-            skipped_count += 1
-            continue
-        
-        # Calculate derived fields
-        winning_team = calculate_winning_team(allies_score, axis_score)
-        match_duration = calculate_duration(start_time, end_time)
-        
-        transformed_matches.append({
-            "match_id": match_id,
-            "map_id": map_id,
-            "map_name": map_name,
-            "map_short_name": map_short_name,
-            "game_mode": game_mode,
-            "environment": environment,
-            "allies_score": allies_score,
-            "axis_score": axis_score,
-            "winning_team": winning_team,
-            "start_time": start_time,
-            "end_time": end_time,
-            "match_duration": match_duration
-        })
+        transformed_matches.append(transformed_match)
         
         # Periodic garbage collection for large datasets
         if idx % 10000 == 0:
@@ -176,7 +168,8 @@ def transform_match_history_data_batched(
         raise FileNotFoundError(f"Source file not found: {SOURCE_FILE}")
     
     # Read and parse JSON
-    file_content = SOURCE_FILE.read_text(encoding="utf-8")
+    # Read as bytes: orjson parses UTF-8 bytes directly, skipping a decode/encode round trip
+    file_content = SOURCE_FILE.read_bytes()
     data = json.loads(file_content)
     result = data.get("result") or {}
     maps = result.get("maps") or []
@@ -197,63 +190,12 @@ def transform_match_history_data_batched(
     processed_count = 0
     
     for idx, entry in enumerate(maps, 1):
-        # Extract match ID
-        match_id = entry.get("id")
-        if match_id is None:
-            skipped_count += 1
-            continue
-        
-        # Extract map information
-        map_info = entry.get("map") or {}
-        map_id = map_info.get("id")
-        if map_id is None:
-            skipped_count += 1
-            continue
-        
-        map_map_info = map_info.get("map") or {}
-        map_name = map_map_info.get("pretty_name")
-        map_short_name = map_map_info.get("shortname")
-        game_mode = map_info.get("game_mode")
-        environment = map_info.get("environment")
-        
-        # Extract result information
-        result_info = entry.get("result") or {}
-        allies_score = result_info.get("allied", 0)
-        axis_score = result_info.get("axis", 0)
-        
-        # Extract timestamps
-        start_str = entry.get("start")
-        end_str = entry.get("end")
-        
-        if not all([map_name, map_short_name, game_mode, environment, start_str, end_str]):
-            skipped_count += 1
-            continue
-        
-        try:
-            start_time = parse_timestamp(start_str)
-            end_time = parse_timestamp(end_str)
-        except (ValueError, TypeError):
+        transformed_match = _extract_match_history_data(entry)
+        if transformed_match is None:
             skipped_count += 1
             continue
         
-        # Calculate derived fields
-        winning_team = calculate_winning_team(allies_score, axis_score)
-        match_duration = calculate_duration(start_time, end_time)
-        
-        batch.append({
-            "match_id": match_id,
-            "map_id": map_id,
-            "map_name": map_name,
-            "map_short_name": map_short_name,
-            "game_mode": game_mode,
-            "environment": environment,
-            "allies_score": allies_score,
-            "axis_score": axis_score,
-            "winning_team": winning_team,
-            "start_time": start_time,
-            "end_time": end_time,
-            "match_duration": match_duration
-        })
+        batch.append(transformed_match)
         
         processed_count += 1
         
@@ -325,14 +267,9 @@ def transform_player_stats_data() -> List[Dict[str, Any]]:
             print(f"  Processed {file_idx}/{total_files} files ({len(transformed_player_stats)} player stats extracted)")
         
         try:
-            # Read file content
-            file_content = file_path.read_text(encoding="utf-8")
-            data = json.loads(file_content)
+            data = _load_json_file(file_path)
             match_result = data.get("result")
             
-            # Release file content immediately after parsing
-            del file_content
-            
             if match_result is None:
                 del data
                 continue
@@ -423,9 +360,15 @@ def transform_player_stats_data_batched(
         if file_idx % PROGRESS_INTERVAL == 0:
             print(f"  Processed {file_idx}/{total_files} files ({total_stats} player stats extracted, {skipped_existing} already in DB)")
         
+        # Skip already-ingested matches before reading/parsing the file
+        if existing_match_ids:
+            filename_match = FILENAME_MATCH_ID_RE.match(file_path.name)
+            if filename_match and int(filename_match.group(1)) in existing_match_ids:
+                skipped_existing += 1
+                continue
+        
         try:
-            file_content = file_path.read_text(encoding="utf-8")
-            data = json.loads(file_content)
+            data = _load_json_file(file_path)
             match_result = data.get("result")
             
             if match_result is None:
@@ -472,6 +415,60 @@ def transform_player_stats_data_batched(
     print(f"\n✓ Player stats transformation complete: {total_stats} player stats from {processed_count} matches ({skipped_files} files skipped, {skipped_existing} already in DB)")
 
 
+def _extract_match_history_data(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Extract match history data from a single entry in the result.maps array.
+    
+    Returns a dictionary with keys matching the match_history table columns,
+    or None if required fields are missing or timestamps cannot be parsed.
+    """
+    match_id = entry.get("id")
+    if match_id is None:
+        return None
+    
+    map_info = entry.get("map") or {}
+    map_id = map_info.get("id")
+    if map_id is None:
+        return None
+    
+    map_map_info = map_info.get("map") or {}
+    map_name = map_map_info.get("pretty_name")
+    map_short_name = map_map_info.get("shortname")
+    game_mode = map_info.get("game_mode")
+    environment = map_info.get("environment")
+    start_str = entry.get("start")
+    end_str = entry.get("end")
+    
+    # Short-circuit on the first missing field instead of building a list for all()
+    if not (map_name and map_short_name and game_mode and environment and start_str and end_str):
+        return None
+    
+    try:
+        start_time = parse_timestamp(start_str)
+        end_time = parse_timestamp(end_str)
+    except (ValueError, TypeError):
+        return None
+    
+    result_info = entry.get("result") or {}
+    allies_score = result_info.get("allied", 0)
+    axis_score = result_info.get("axis", 0)
+    
+    return {
+        "match_id": match_id,
+        "map_id": map_id,
+        "map_name": map_name,
+        "map_short_name": map_short_name,
+        "game_mode": game_mode,
+        "environment": environment,
+        "allies_score": allies_score,
+        "axis_score": axis_score,
+        "winning_team": calculate_winning_team(allies_score, axis_score),
+        "start_time": start_time,
+        "end_time": end_time,
+        "match_duration": calculate_duration(start_time, end_time),
+    }
+
+
 def _extract_player_stat_data(
     player_stat: Dict[str, Any],
     match_id: int
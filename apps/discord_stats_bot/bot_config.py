@@ -8,7 +8,7 @@ import logging
 import os
 
 from pathlib import Path
-from typing import Optional, Set
+from typing import FrozenSet, Optional
 
 logger = logging.getLogger(__name__)
 try:
@@ -22,21 +22,44 @@ ROOT_DIR = APPS_DIR.parent
 ENV_FILE = ROOT_DIR / ".env"
 DOCKER_ENV_FILE = ROOT_DIR / "infra" / "docker" / ".env"
 
+
+def _find_env_file() -> Optional[Path]:
+    """
+    Resolve the .env file to load.
+    
+    DISCORD_ENV_FILE, when set, is used as-is without probing the filesystem;
+    otherwise the first existing candidate is returned.
+    """
+    override = os.getenv("DISCORD_ENV_FILE")
+    if override:
+        return Path(override)
+    for env_path in (DOCKER_ENV_FILE, ENV_FILE):
+        if env_path.exists():
+            return env_path
+    return None
+
+
 if load_dotenv is None:
     logger.warning("dotenv not available, using system environment variables only")
 else:
-    env_loaded = False
-    for env_path in [DOCKER_ENV_FILE, ENV_FILE]:
-        if env_path.exists():
-            try:
-                load_dotenv(dotenv_path=env_path, override=False)
-                logger.info(f"Loaded .env from {env_path}")
-                env_loaded = True
-                break
-            except Exception as e:
-                logger.error(f"Failed to load {env_path}: {e}", exc_info=True)
-    if not env_loaded:
+    env_path = _find_env_file()
+    if env_path is None:
         logger.info("No .env file found")
+    else:
+        try:
+            load_dotenv(dotenv_path=env_path, override=False)
+            logger.info(f"Loaded .env from {env_path}")
+        except Exception as e:
+            logger.error(f"Failed to load {env_path}: {e}", exc_info=True)
+
+
+def _parse_id_list(ids_str: str) -> FrozenSet[int]:
+    """Parse a comma-separated list of Discord IDs into an immutable set."""
+    return frozenset(
+        int(id_str.strip())
+        for id_str in ids_str.split(",")
+        if id_str.strip()
+    )
 
 
 class DiscordBotConfig:
@@ -48,15 +71,9 @@ class DiscordBotConfig:
         if not self.token:
             raise ValueError("DISCORD_BOT_TOKEN environment variable is required")
         
-        allowed_channels_str = os.getenv("DISCORD_ALLOWED_CHANNEL_IDS", "")
-        if allowed_channels_str:
-            self.allowed_channel_ids: Set[int] = {
-                int(channel_id.strip())
-                for channel_id in allowed_channels_str.split(",")
-                if channel_id.strip()
-            }
-        else:
-            self.allowed_channel_ids: Set[int] = set()
+        self.allowed_channel_ids: FrozenSet[int] = _parse_id_list(
+            os.getenv("DISCORD_ALLOWED_CHANNEL_IDS", "")
+        )
         
         dev_guild_id_str = os.getenv("DISCORD_DEV_GUILD_ID")
         self.dev_guild_id: Optional[int] = int(dev_guild_id_str) if dev_guild_id_str else None
@@ -65,15 +82,9 @@ class DiscordBotConfig:
         self.stats_channel_id: Optional[int] = int(stats_channel_id_str) if stats_channel_id_str else None
         
         # Parse allowed role IDs for channel cleanup (comma-separated list)
-        cleanup_allowed_roles_str = os.getenv("DISCORD_CLEANUP_ALLOWED_ROLE_IDS", "")
-        if cleanup_allowed_roles_str:
-            self.cleanup_allowed_role_ids: Set[int] = {
-                int(role_id.strip())
-                for role_id in cleanup_allowed_roles_str.split(",")
-                if role_id.strip()
-            }
-        else:
-            self.cleanup_allowed_role_ids: Set[int] = set()
+        self.cleanup_allowed_role_ids: FrozenSet[int] = _parse_id_list(
+            os.getenv("DISCORD_CLEANUP_ALLOWED_ROLE_IDS", "")
+        )
     
     def __repr__(self) -> str:
         return (
@@ -17,14 +17,16 @@ from discord import app_commands
 
 from apps.discord_stats_bot.common import (
     get_readonly_db_pool,
-    find_player_by_id_or_name,
-    log_command_data,
+    find_player_via_pool,
     log_command_completion,
     set_player_id,
     clear_player_id,
     set_format_preference,
     VALID_FORMATS,
     FORMAT_DISPLAY_NAMES,
+    command_wrapper,
+    READONLY_POOL_ACQUIRE_TIMEOUT,
+    PoolBusyError,
 )
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,11 @@ FORMAT_CHOICES = [
     app_commands.Choice(name="Numbered List", value="list"),
 ]
 
+# Lowercased "name\x00value" haystack per choice, so autocomplete does one substring test
+_FORMAT_CHOICES_LC = [
+    (choice, f"{choice.name}\x00{choice.value}".lower()) for choice in FORMAT_CHOICES
+]
+
 # Format name to value mapping
 FORMAT_MAPPING = {
     "cards": "cards",
@@ -48,6 +55,9 @@ FORMAT_MAPPING = {
     "numbered list": "list",
 }
 
+# Normalized input -> format value; a miss means the format is invalid
+_FORMAT_LOOKUP = {k.lower(): v for k, v in FORMAT_MAPPING.items()} | {v: v for v in VALID_FORMATS}
+
 
 async def format_autocomplete(
     interaction: discord.Interaction,
@@ -55,10 +65,7 @@ async def format_autocomplete(
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete function for format parameter."""
     current_lower = current.lower()
-    matching = [
-        choice for choice in FORMAT_CHOICES
-        if current_lower in choice.name.lower() or current_lower in choice.value.lower()
-    ]
+    matching = [choice for choice, haystack in _FORMAT_CHOICES_LC if current_lower in haystack]
     return matching[:25]
 
 
@@ -74,89 +81,58 @@ def setup_profile_command(tree: app_commands.CommandTree, channel_check=None) ->
         description="Set your default player ID so you don't have to enter it every time"
     )
     @app_commands.describe(player="Your player ID or player name")
+    @command_wrapper("profile setid", channel_check=channel_check)
     async def profile_setid(interaction: discord.Interaction, player: str):
         """Set your default player ID."""
-        start_time = time.time()
-        log_command_data(interaction, "profile setid", player=player)
+        command_start_time = time.time()
+        log_kwargs = {"player": player}
         
+        pool = await get_readonly_db_pool()
         try:
-            if channel_check and not channel_check(interaction):
-                await interaction.response.send_message(
-                    "❌ This bot can only be used in the designated channel.",
-                    ephemeral=True
-                )
-                log_command_completion("profile setid", start_time, success=False, interaction=interaction, kwargs={"player": player})
-                return
-            
-            await interaction.response.defer(ephemeral=True)
-            
-            pool = await get_readonly_db_pool()
-            async with pool.acquire() as conn:
-                player_id, found_player_name = await find_player_by_id_or_name(conn, player)
-                
-                if not player_id:
-                    await interaction.followup.send(
-                        f"❌ Could not find player: `{player}` Try using a player ID or exact player name.", 
-                        ephemeral=True
-                    )
-                    log_command_completion("profile setid", start_time, success=False, interaction=interaction, kwargs={"player": player})
-                    return
-                
-                await set_player_id(interaction.user.id, player_id)
-                
-                display_name = found_player_name if found_player_name else player_id
-                await interaction.followup.send(
-                    f"✅ Your player ID has been set to: `{display_name}` ({player_id})\n"
-                    f"You can now use commands without specifying a player ID!",
-                    ephemeral=True
-                )
-                log_command_completion("profile setid", start_time, success=True, interaction=interaction, kwargs={"player": player})
-                    
-        except Exception as e:
-            logger.error(f"Error in profile setid: {e}", exc_info=True)
-            log_command_completion("profile setid", start_time, success=False, interaction=interaction, kwargs={"player": player})
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    f"❌ An unexpected error occurred: {str(e)}",
-                    ephemeral=True
-                )
-            else:
-                await interaction.followup.send(
-                    f"❌ An unexpected error occurred: {str(e)}",
-                    ephemeral=True
-                )
+            # Connection is acquired only on a lookup cache miss and released before replying
+            player_id, found_player_name = await find_player_via_pool(
+                pool, player, acquire_timeout=READONLY_POOL_ACQUIRE_TIMEOUT
+            )
+        except PoolBusyError:
+            logger.warning("Timed out waiting for a database connection in profile setid")
+            await interaction.followup.send(
+                "⏳ The bot is busy right now, please try again in a moment.",
+                ephemeral=True
+            )
+            log_command_completion("profile setid", command_start_time, success=False, interaction=interaction, kwargs=log_kwargs)
+            return
+        
+        if not player_id:
+            await interaction.followup.send(
+                f"❌ Could not find player: `{player}` Try using a player ID or exact player name.", 
+                ephemeral=True
+            )
+            log_command_completion("profile setid", command_start_time, success=False, interaction=interaction, kwargs=log_kwargs)
+            return
+        
+        await set_player_id(interaction.user.id, player_id)
+        
+        display_name = found_player_name if found_player_name else player_id
+        await interaction.followup.send(
+            f"✅ Your player ID has been set to: `{display_name}` ({player_id})\n"
+            f"You can now use commands without specifying a player ID!",
+            ephemeral=True
+        )
+        log_command_completion("profile setid", command_start_time, success=True, interaction=interaction, kwargs=log_kwargs)
 
     @profile_group.command(name="clearid", description="Clear your stored player ID")
+    @command_wrapper("profile clearid", channel_check=channel_check)
     async def profile_clearid(interaction: discord.Interaction):
         """Clear your stored player ID."""
-        start_time = time.time()
-        log_command_data(interaction, "profile clearid")
+        command_start_time = time.time()
         
-        try:
-            if channel_check and not channel_check(interaction):
-                await interaction.response.send_message(
-                    "❌ This bot can only be used in the designated channel.",
-                    ephemeral=True
-                )
-                log_command_completion("profile clearid", start_time, success=False, interaction=interaction, kwargs={})
-                return
-            
-            await clear_player_id(interaction.user.id)
-            
-            await interaction.response.send_message(
-                "✅ Your player ID has been cleared. Use `/profile setid` to set a new one.", 
-                ephemeral=True
-            )
-            log_command_completion("profile clearid", start_time, success=True, interaction=interaction, kwargs={})
-            
-        except Exception as e:
-            logger.error(f"Error in profile clearid: {e}", exc_info=True)
-            log_command_completion("profile clearid", start_time, success=False, interaction=interaction, kwargs={})
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    f"❌ An unexpected error occurred: {str(e)}",
-                    ephemeral=True
-                )
+        await clear_player_id(interaction.user.id)
+        
+        await interaction.followup.send(
+            "✅ Your player ID has been cleared. Use `/profile setid` to set a new one.", 
+            ephemeral=True
+        )
+        log_command_completion("profile clearid", command_start_time, success=True, interaction=interaction, kwargs={})
 
     @profile_group.command(
         name="format", 
@@ -166,48 +142,30 @@ def setup_profile_command(tree: app_commands.CommandTree, channel_check=None) ->
         format_type="Display format: Cards (embeds), ASCII Table, or Numbered List"
     )
     @app_commands.autocomplete(format_type=format_autocomplete)
+    @command_wrapper("profile format", channel_check=channel_check)
     async def profile_format(interaction: discord.Interaction, format_type: str):
         """Set your preferred leaderboard display format."""
-        start_time = time.time()
-        log_command_data(interaction, "profile format", format_type=format_type)
+        command_start_time = time.time()
+        log_kwargs = {"format_type": format_type}
         
-        try:
-            if channel_check and not channel_check(interaction):
-                await interaction.response.send_message(
-                    "❌ This bot can only be used in the designated channel.",
-                    ephemeral=True
-                )
-                log_command_completion("profile format", start_time, success=False, interaction=interaction, kwargs={"format_type": format_type})
-                return
-            
-            format_lower = format_type.lower().strip()
-            format_value = FORMAT_MAPPING.get(format_lower)
-            
-            if format_value not in VALID_FORMATS:
-                await interaction.response.send_message(
-                    f"❌ Invalid format: `{format_type}`. Valid formats: Cards (Embeds), ASCII Table, Numbered List",
-                    ephemeral=True
-                )
-                log_command_completion("profile format", start_time, success=False, interaction=interaction, kwargs={"format_type": format_type})
-                return
-            
-            await set_format_preference(interaction.user.id, format_value)
-            
-            display_name = FORMAT_DISPLAY_NAMES.get(format_value, format_value)
-            await interaction.response.send_message(
-                f"✅ Your leaderboard display format has been set to: **{display_name}**\n"
-                f"All `/leaderboard` commands will now use this format.",
+        format_value = _FORMAT_LOOKUP.get(format_type.strip().lower())
+        
+        if format_value is None:
+            await interaction.followup.send(
+                f"❌ Invalid format: `{format_type}`. Valid formats: Cards (Embeds), ASCII Table, Numbered List",
                 ephemeral=True
             )
-            log_command_completion("profile format", start_time, success=True, interaction=interaction, kwargs={"format_type": format_type})
-            
-        except Exception as e:
-            logger.error(f"Error in profile format: {e}", exc_info=True)
-            log_command_completion("profile format", start_time, success=False, interaction=interaction, kwargs={"format_type": format_type})
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    f"❌ An unexpected error occurred: {str(e)}",
-                    ephemeral=True
-                )
+            log_command_completion("profile format", command_start_time, success=False, interaction=interaction, kwargs=log_kwargs)
+            return
+        
+        await set_format_preference(interaction.user.id, format_value)
+        
+        display_name = FORMAT_DISPLAY_NAMES.get(format_value, format_value)
+        await interaction.followup.send(
+            f"✅ Your leaderboard display format has been set to: **{display_name}**\n"
+            f"All `/leaderboard` commands will now use this format.",
+            ephemeral=True
+        )
+        log_command_completion("profile format", command_start_time, success=True, interaction=interaction, kwargs=log_kwargs)
 
     tree.add_command(profile_group)
@@ -16,11 +16,14 @@ from apps.discord_stats_bot.common.database import (
     get_readonly_db_pool,
     get_pathfinder_leaderboard_pool,
     close_db_pool,
+    READONLY_POOL_ACQUIRE_TIMEOUT,
 )
 
 # Player utilities
 from apps.discord_stats_bot.common.player_lookup import (
     find_player_by_id_or_name,
+    find_player_via_pool,
+    PoolBusyError,
     get_pathfinder_player_ids,
     resolve_player_input,
     lookup_player,
@@ -39,6 +42,8 @@ from apps.discord_stats_bot.common.user_cache import (
     set_format_preference,
     clear_format_preference,
     initialize_format_cache,
+    flush_format_cache,
+    flush_format_cache_at_exit,
     VALID_FORMATS,
     FORMAT_DISPLAY_NAMES,
     DEFAULT_FORMAT,
@@ -49,6 +54,7 @@ from apps.discord_stats_bot.common.logging import (
     log_command_data,
     log_command_completion,
     get_command_latency_ms,
+    setup_queue_logging,
 )
 
 # Input validation
@@ -73,6 +79,8 @@ from apps.discord_stats_bot.common.sql_builders import (
 from apps.discord_stats_bot.common.decorators import (
     command_wrapper,
     handle_command_errors,
+    send_ephemeral_reply,
+    CHANNEL_NOT_ALLOWED_ERROR,
 )
 
 # Autocomplete functions (types, weapons, maps)
@@ -147,8 +155,11 @@ __all__ = [
     'get_readonly_db_pool',
     'get_pathfinder_leaderboard_pool',
     'close_db_pool',
+    'READONLY_POOL_ACQUIRE_TIMEOUT',
     # Player
     'find_player_by_id_or_name',
+    'find_player_via_pool',
+    'PoolBusyError',
     'get_pathfinder_player_ids',
     'resolve_player_input',
     'lookup_player',
@@ -164,6 +175,8 @@ __all__ = [
     'set_format_preference',
     'clear_format_preference',
     'initialize_format_cache',
+    'flush_format_cache',
+    'flush_format_cache_at_exit',
     'VALID_FORMATS',
     'FORMAT_DISPLAY_NAMES',
     'DEFAULT_FORMAT',
@@ -171,6 +184,7 @@ __all__ = [
     'log_command_data',
     'log_command_completion',
     'get_command_latency_ms',
+    'setup_queue_logging',
     # Validation
     'validate_over_last_days',
     'validate_choice_parameter',
@@ -186,6 +200,8 @@ __all__ = [
     # Decorators
     'command_wrapper',
     'handle_command_errors',
+    'send_ephemeral_reply',
+    'CHANNEL_NOT_ALLOWED_ERROR',
     # Autocomplete
     'kill_type_autocomplete',
     'death_type_autocomplete',
@@ -13,7 +13,10 @@ import logging
 
 import discord
 
-from typing import Dict, List, Set, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Set, Tuple
 from discord import app_commands
 
 from libs.hll_data import WEAPON_SCHEMAS_PATH, MAP_ID_NAME_MAPPINGS_PATH
@@ -32,20 +35,54 @@ logger = logging.getLogger(__name__)
 # Generic choice filtering
 # =============================================================================
 
+@dataclass(frozen=True)
+class LoweredChoices:
+    """Constant choices paired with their lowercased name and value, plus the empty-query reply."""
+    default: List[app_commands.Choice[str]]
+    rows: Tuple[Tuple[app_commands.Choice[str], str, str], ...]
+
+
+def _lower_choices(choices: List[app_commands.Choice[str]]) -> LoweredChoices:
+    """Pair each choice with its lowercased name and value for filtering."""
+    return LoweredChoices(
+        default=choices[:25],
+        rows=tuple((choice, choice.name.lower(), choice.value.lower()) for choice in choices),
+    )
+
+
+# Choice lists are constants, so lowercase them once instead of per keystroke
+_KILL_TYPE_CHOICES_LOWERED = _lower_choices(KILL_TYPE_CHOICES)
+_DEATH_TYPE_CHOICES_LOWERED = _lower_choices(DEATH_TYPE_CHOICES)
+_SCORE_TYPE_CHOICES_LOWERED = _lower_choices(SCORE_TYPE_CHOICES)
+_STAT_TYPE_CHOICES_LOWERED = _lower_choices(STAT_TYPE_CHOICES)
+_AGGREGATE_BY_CHOICES_LOWERED = _lower_choices(AGGREGATE_BY_CHOICES)
+_ORDER_BY_CHOICES_LOWERED = _lower_choices(ORDER_BY_CHOICES)
+
+# No choice, weapon or map name comes close to this, so longer input can never match
+_MAX_QUERY_LENGTH = 100
+
+
 def _filter_choices(
-    choices: List[app_commands.Choice[str]], 
+    lowered_choices: LoweredChoices, 
     current: str
 ) -> List[app_commands.Choice[str]]:
-    """Filter choices based on current input."""
+    """Filter pre-lowered choices based on current input, ranking prefix matches first."""
     if not current:
-        return choices[:25]
+        return lowered_choices.default
+    if len(current) > _MAX_QUERY_LENGTH:
+        return []
     
     current_lower = current.lower()
-    matching = [
-        choice for choice in choices
-        if current_lower in choice.name.lower() or current_lower in choice.value.lower()
-    ]
-    return matching[:25]
+    prefix_hits = []
+    infix_hits = []
+    for choice, name_lower, value_lower in lowered_choices.rows:
+        if name_lower.startswith(current_lower) or value_lower.startswith(current_lower):
+            prefix_hits.append(choice)
+            if len(prefix_hits) == 25:
+                return prefix_hits
+        elif len(infix_hits) < 25 and (current_lower in name_lower or current_lower in value_lower):
+            infix_hits.append(choice)
+    return (prefix_hits + infix_hits)[:25]
 
 
 # =============================================================================
@@ -57,7 +94,7 @@ async def kill_type_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for kill_type parameter."""
-    return _filter_choices(KILL_TYPE_CHOICES, current)
+    return _filter_choices(_KILL_TYPE_CHOICES_LOWERED, current)
 
 
 async def death_type_autocomplete(
@@ -65,7 +102,7 @@ async def death_type_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for death_type parameter."""
-    return _filter_choices(DEATH_TYPE_CHOICES, current)
+    return _filter_choices(_DEATH_TYPE_CHOICES_LOWERED, current)
 
 
 async def score_type_autocomplete(
@@ -73,7 +110,7 @@ async def score_type_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for score_type parameter."""
-    return _filter_choices(SCORE_TYPE_CHOICES, current)
+    return _filter_choices(_SCORE_TYPE_CHOICES_LOWERED, current)
 
 
 async def stat_type_autocomplete(
@@ -81,7 +118,7 @@ async def stat_type_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for stat_type parameter."""
-    return _filter_choices(STAT_TYPE_CHOICES, current)
+    return _filter_choices(_STAT_TYPE_CHOICES_LOWERED, current)
 
 
 async def aggregate_by_autocomplete(
@@ -89,7 +126,7 @@ async def aggregate_by_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for aggregate_by parameter."""
-    return _filter_choices(AGGREGATE_BY_CHOICES, current)
+    return _filter_choices(_AGGREGATE_BY_CHOICES_LOWERED, current)
 
 
 async def order_by_autocomplete(
@@ -97,95 +134,126 @@ async def order_by_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for order_by parameter."""
-    return _filter_choices(ORDER_BY_CHOICES, current)
+    return _filter_choices(_ORDER_BY_CHOICES_LOWERED, current)
+
+
+@dataclass(frozen=True, slots=True)
+class NameIndex:
+    """
+    Sorted names loaded from CSV with parallel lowercase spellings and choices.
+    
+    Built complete by a loader and published with a single assignment, so readers
+    never see the fields of two different loads mixed together.
+    """
+    names: Tuple[str, ...] = ()
+    names_lower: Tuple[str, ...] = ()
+    choices: Tuple[app_commands.Choice[str], ...] = ()
+    default_choices: List[app_commands.Choice[str]] = field(default_factory=list)
+
+
+def _build_name_index(names: Tuple[str, ...], names_lower: Tuple[str, ...]) -> NameIndex:
+    """Build a NameIndex from sorted names and their lowercase spellings."""
+    choices = tuple(app_commands.Choice(name=name, value=name) for name in names)
+    return NameIndex(
+        names=names,
+        names_lower=names_lower,
+        choices=choices,
+        default_choices=list(choices[:25]),
+    )
+
+
+def _match_names(index: NameIndex, current_lower: str) -> List[app_commands.Choice[str]]:
+    """
+    Return up to 25 cached choices whose name contains current_lower, prefix matches first.
+    
+    names_lower and choices are parallel tuples, so the scan runs over plain strings.
+    """
+    choices = index.choices
+    prefix_hits = []
+    infix_hits = []
+    for i, lower in enumerate(index.names_lower):
+        if lower.startswith(current_lower):
+            prefix_hits.append(choices[i])
+            if len(prefix_hits) == 25:
+                return prefix_hits
+        elif len(infix_hits) < 25 and current_lower in lower:
+            infix_hits.append(choices[i])
+    return (prefix_hits + infix_hits)[:25]
+
+
+def _iter_csv_columns(path: Path, *columns: str) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the requested columns of each CSV row as stripped strings.
+    
+    Column indices are resolved from the header once; cells missing from a short
+    row are returned as empty strings. Raises ValueError if a column is absent.
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = [name.lstrip('\ufeff').strip() for name in next(reader, [])]
+        indices = [header.index(column) for column in columns]
+        for row in reader:
+            yield tuple(row[i].strip() if i < len(row) else '' for i in indices)
 
 
 # =============================================================================
 # Weapon autocomplete with caching
 # =============================================================================
 
-_WEAPON_NAMES_CACHE: List[str] = []
-_WEAPON_NAMES_LOWER_CACHE: List[Tuple[str, str]] = []
+_WEAPON_INDEX = NameIndex()
 _WEAPON_MAPPING_CACHE: Dict[str, str] = {}
 
 
-def _load_weapon_names() -> None:
-    """Load weapon names from CSV and cache them."""
-    global _WEAPON_NAMES_CACHE, _WEAPON_NAMES_LOWER_CACHE
+def _load_weapons() -> None:
+    """Load weapon names and the friendly name -> column name mapping from CSV in one pass."""
+    global _WEAPON_INDEX, _WEAPON_MAPPING_CACHE
     
-    if _WEAPON_NAMES_CACHE:
+    if _WEAPON_INDEX.names:
         return
     
     if not WEAPON_SCHEMAS_PATH.exists():
         logger.warning(f"Weapon schemas file not found: {WEAPON_SCHEMAS_PATH}")
         return
     
-    friendly_names = []
+    # Lowercased name -> first-seen spelling, deduplicating in the same pass
+    unique_names: Dict[str, str] = {}
+    mapping: Dict[str, str] = {}
     
     try:
-        with open(WEAPON_SCHEMAS_PATH, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                friendly_names_str = row.get('FriendlyName', '').strip()
-                if not friendly_names_str:
+        for weapon_type, friendly_names_str in _iter_csv_columns(
+            WEAPON_SCHEMAS_PATH, 'WeaponType', 'FriendlyName'
+        ):
+            if not friendly_names_str:
+                continue
+            
+            column_name = weapon_type.lower()
+            for name in friendly_names_str.split(';'):
+                name = name.strip()
+                if not name:
                     continue
-                names = [name.strip() for name in friendly_names_str.split(';') if name.strip()]
-                friendly_names.extend(names)
+                name_lower = name.lower()
+                unique_names.setdefault(name_lower, name)
+                if column_name:
+                    mapping[name_lower] = column_name
         
-        seen = set()
-        unique_names = []
-        for name in friendly_names:
-            if name.lower() not in seen:
-                seen.add(name.lower())
-                unique_names.append(name)
+        # Sort by spelling but keep each lowercased key, so no name is lowered twice
+        sorted_names = sorted(unique_names.items(), key=lambda item: item[1])
+        _WEAPON_INDEX = _build_name_index(
+            tuple(name for _, name in sorted_names),
+            tuple(name_lower for name_lower, _ in sorted_names),
+        )
+        _WEAPON_MAPPING_CACHE = mapping
         
-        _WEAPON_NAMES_CACHE = sorted(unique_names)
-        _WEAPON_NAMES_LOWER_CACHE = [(name.lower(), name) for name in _WEAPON_NAMES_CACHE]
-        
-        logger.info(f"Loaded {len(_WEAPON_NAMES_CACHE)} weapon names")
+        logger.info(f"Loaded {len(_WEAPON_INDEX.names)} weapon names and {len(_WEAPON_MAPPING_CACHE)} weapon mappings")
     
     except Exception as e:
         logger.error(f"Failed to load weapon schemas: {e}", exc_info=True)
-        _WEAPON_NAMES_CACHE = []
-        _WEAPON_NAMES_LOWER_CACHE = []
-
-
-def _load_weapon_mapping() -> None:
-    """Load friendly name -> column name mapping from CSV."""
-    global _WEAPON_MAPPING_CACHE
-    
-    if _WEAPON_MAPPING_CACHE:
-        return
-    
-    if not WEAPON_SCHEMAS_PATH.exists():
-        logger.warning(f"Weapon schemas file not found: {WEAPON_SCHEMAS_PATH}")
-        return
-    
-    try:
-        with open(WEAPON_SCHEMAS_PATH, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                weapon_type = row.get('WeaponType', '').strip() or row.get('\ufeffWeaponType', '').strip()
-                friendly_names_str = row.get('FriendlyName', '').strip()
-                
-                if not weapon_type or not friendly_names_str:
-                    continue
-                
-                column_name = weapon_type.lower()
-                friendly_names = [name.strip() for name in friendly_names_str.split(';') if name.strip()]
-                for name in friendly_names:
-                    _WEAPON_MAPPING_CACHE[name.lower()] = column_name
-        
-        logger.info(f"Loaded {len(_WEAPON_MAPPING_CACHE)} weapon mappings")
-    
-    except Exception as e:
-        logger.error(f"Failed to load weapon mapping: {e}", exc_info=True)
+        _WEAPON_INDEX = NameIndex()
         _WEAPON_MAPPING_CACHE = {}
 
 
 # Initialize weapon caches on module import
-_load_weapon_names()
-_load_weapon_mapping()
+_load_weapons()
 
 
 async def weapon_category_autocomplete(
@@ -193,85 +261,83 @@ async def weapon_category_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Return matching weapon categories for autocomplete (up to 25)."""
-    if not _WEAPON_NAMES_CACHE:
-        _load_weapon_names()
+    if not _WEAPON_INDEX.names:
+        _load_weapons()
     
+    index = _WEAPON_INDEX
     if not current:
-        return [
-            app_commands.Choice(name=name, value=name)
-            for name in _WEAPON_NAMES_CACHE[:25]
-        ]
-    
-    current_lower = current.lower()
-    matching = [
-        app_commands.Choice(name=original, value=original)
-        for lower, original in _WEAPON_NAMES_LOWER_CACHE
-        if current_lower in lower
-    ]
+        return index.default_choices
+    if len(current) > _MAX_QUERY_LENGTH:
+        return []
     
-    return matching[:25]
+    return _match_names(index, current.lower())
 
 
-def get_weapon_names() -> List[str]:
-    """Get the cached list of weapon names."""
-    if not _WEAPON_NAMES_CACHE:
-        _load_weapon_names()
-    return _WEAPON_NAMES_CACHE.copy()
+def get_weapon_names() -> Tuple[str, ...]:
+    """Get the cached weapon names (shared, immutable)."""
+    if not _WEAPON_INDEX.names:
+        _load_weapons()
+    return _WEAPON_INDEX.names
 
 
-def get_weapon_mapping() -> Dict[str, str]:
-    """Get the cached weapon mapping (friendly name -> column name)."""
+def get_weapon_mapping() -> Mapping[str, str]:
+    """Get a read-only view of the cached weapon mapping (friendly name -> column name)."""
     if not _WEAPON_MAPPING_CACHE:
-        _load_weapon_mapping()
-    return _WEAPON_MAPPING_CACHE.copy()
+        _load_weapons()
+    return MappingProxyType(_WEAPON_MAPPING_CACHE)
 
 
 # =============================================================================
 # Map autocomplete with caching
 # =============================================================================
 
-_MAP_NAMES_CACHE: List[str] = []
-_MAP_NAMES_LOWER_CACHE: List[Tuple[str, str]] = []
+_MAP_INDEX = NameIndex()
+_MAP_LOWER_TO_NAME_CACHE: Dict[str, str] = {}
 _MAP_ID_TO_NAME_CACHE: Dict[str, str] = {}
-_MAP_NAME_TO_IDS_CACHE: Dict[str, Set[str]] = {}
+_MAP_NAME_TO_IDS_CACHE: Dict[str, FrozenSet[str]] = {}
 
 
 def _load_map_names() -> None:
     """Load map names from CSV and cache them."""
-    global _MAP_NAMES_CACHE, _MAP_NAMES_LOWER_CACHE, _MAP_ID_TO_NAME_CACHE, _MAP_NAME_TO_IDS_CACHE
+    global _MAP_INDEX, _MAP_LOWER_TO_NAME_CACHE
+    global _MAP_ID_TO_NAME_CACHE, _MAP_NAME_TO_IDS_CACHE
     
-    if _MAP_NAMES_CACHE:
+    if _MAP_INDEX.names:
         return
     
     if not MAP_ID_NAME_MAPPINGS_PATH.exists():
         logger.warning(f"Map ID name mappings file not found: {MAP_ID_NAME_MAPPINGS_PATH}")
         return
     
+    map_id_to_name: Dict[str, str] = {}
+    map_name_to_ids: Dict[str, Set[str]] = {}
+    
     try:
-        with open(MAP_ID_NAME_MAPPINGS_PATH, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                map_id = row.get('map_id', '').strip()
-                map_pretty_name = row.get('map_pretty_name', '').strip()
-                
-                if not map_id or not map_pretty_name:
-                    continue
-                
-                _MAP_ID_TO_NAME_CACHE[map_id] = map_pretty_name
-                
-                if map_pretty_name not in _MAP_NAME_TO_IDS_CACHE:
-                    _MAP_NAME_TO_IDS_CACHE[map_pretty_name] = set()
-                _MAP_NAME_TO_IDS_CACHE[map_pretty_name].add(map_id)
+        for map_id, map_pretty_name in _iter_csv_columns(
+            MAP_ID_NAME_MAPPINGS_PATH, 'map_id', 'map_pretty_name'
+        ):
+            if not map_id or not map_pretty_name:
+                continue
+            
+            map_id_to_name[map_id] = map_pretty_name
+            
+            if map_pretty_name not in map_name_to_ids:
+                map_name_to_ids[map_pretty_name] = set()
+            map_name_to_ids[map_pretty_name].add(map_id)
         
-        _MAP_NAMES_CACHE = sorted(_MAP_NAME_TO_IDS_CACHE.keys())
-        _MAP_NAMES_LOWER_CACHE = [(name.lower(), name) for name in _MAP_NAMES_CACHE]
+        names = tuple(sorted(map_name_to_ids.keys()))
+        index = _build_name_index(names, tuple(name.lower() for name in names))
+        _MAP_ID_TO_NAME_CACHE = map_id_to_name
+        _MAP_NAME_TO_IDS_CACHE = {name: frozenset(ids) for name, ids in map_name_to_ids.items()}
+        _MAP_LOWER_TO_NAME_CACHE = dict(zip(index.names_lower, index.names))
+        _MAP_INDEX = index
         
-        logger.info(f"Loaded {len(_MAP_NAMES_CACHE)} unique map names from {len(_MAP_ID_TO_NAME_CACHE)} map IDs")
+        logger.info(f"Loaded {len(_MAP_INDEX.names)} unique map names from {len(_MAP_ID_TO_NAME_CACHE)} map IDs")
     
     except Exception as e:
         logger.error(f"Failed to load map name mappings: {e}", exc_info=True)
-        _MAP_NAMES_CACHE = []
-        _MAP_NAMES_LOWER_CACHE = []
+        _MAP_INDEX = NameIndex()
+        _MAP_LOWER_TO_NAME_CACHE = {}
         _MAP_ID_TO_NAME_CACHE = {}
         _MAP_NAME_TO_IDS_CACHE = {}
 
@@ -285,37 +351,30 @@ async def map_name_autocomplete(
     current: str,
 ) -> List[app_commands.Choice[str]]:
     """Return matching map names for autocomplete (up to 25)."""
-    if not _MAP_NAMES_CACHE:
+    if not _MAP_INDEX.names:
         _load_map_names()
     
+    index = _MAP_INDEX
     if not current:
-        return [
-            app_commands.Choice(name=name, value=name)
-            for name in _MAP_NAMES_CACHE[:25]
-        ]
+        return index.default_choices
+    if len(current) > _MAX_QUERY_LENGTH:
+        return []
     
-    current_lower = current.lower()
-    matching = [
-        app_commands.Choice(name=original, value=original)
-        for lower, original in _MAP_NAMES_LOWER_CACHE
-        if current_lower in lower
-    ]
-    
-    return matching[:25]
+    return _match_names(index, current.lower())
 
 
-def get_map_names() -> List[str]:
-    """Get the cached list of unique map names."""
-    if not _MAP_NAMES_CACHE:
+def get_map_names() -> Tuple[str, ...]:
+    """Get the cached unique map names (shared, immutable)."""
+    if not _MAP_INDEX.names:
         _load_map_names()
-    return _MAP_NAMES_CACHE.copy()
+    return _MAP_INDEX.names
 
 
-def get_map_ids_for_name(map_pretty_name: str) -> Set[str]:
+def get_map_ids_for_name(map_pretty_name: str) -> FrozenSet[str]:
     """Get all map IDs that correspond to a given pretty map name."""
     if not _MAP_NAME_TO_IDS_CACHE:
         _load_map_names()
-    return _MAP_NAME_TO_IDS_CACHE.get(map_pretty_name, set()).copy()
+    return _MAP_NAME_TO_IDS_CACHE.get(map_pretty_name, frozenset())
 
 
 def get_map_name_for_id(map_id: str) -> str:
@@ -330,12 +389,7 @@ def find_map_name_case_insensitive(map_name: str) -> str:
     
     Returns the properly cased map name if found, otherwise returns the input as-is.
     """
-    if not _MAP_NAMES_CACHE:
+    if not _MAP_INDEX.names:
         _load_map_names()
     
-    map_name_lower = map_name.lower().strip()
-    for lower, original in _MAP_NAMES_LOWER_CACHE:
-        if lower == map_name_lower:
-            return original
-    
-    return map_name
+    return _MAP_LOWER_TO_NAME_CACHE.get(map_name.lower().strip(), map_name)
@@ -7,7 +7,7 @@ import os
 
 import asyncpg
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from libs.db.config import get_db_config
 
@@ -24,16 +24,32 @@ PATHFINDER_LEADERBOARD_COMMAND_TIMEOUT = int(
     os.getenv("PATHFINDER_LEADERBOARD_COMMAND_TIMEOUT", "330")
 )
 
+# Read-only pool sizing; min_size connections are opened up front so bursts
+# of commands do not wait on connection establishment
+READONLY_POOL_MIN_SIZE = int(os.getenv("READONLY_POOL_MIN_SIZE", "5"))
+READONLY_POOL_MAX_SIZE = int(os.getenv("READONLY_POOL_MAX_SIZE", "15"))
 
-async def get_readonly_db_pool() -> asyncpg.Pool:
+# Seconds an interaction waits for a read-only connection before giving up
+READONLY_POOL_ACQUIRE_TIMEOUT = float(os.getenv("READONLY_POOL_ACQUIRE_TIMEOUT", "2"))
+
+# Validated read-only connection settings, resolved once from the environment
+_readonly_connect_kwargs: Optional[Dict[str, Any]] = None
+
+
+def _get_readonly_connect_kwargs() -> Dict[str, Any]:
     """
-    Get or create the async PostgreSQL connection pool (read-only user).
-    This pool is created on first call and reused for subsequent calls.
+    Get the read-only user's connection settings for asyncpg.create_pool.
+    
+    The environment is read and validated on first call and the result reused,
+    so recreating a pool does not re-parse the config.
+    
+    Raises:
+        ValueError: If a required setting is missing
     """
-    global _db_pool
+    global _readonly_connect_kwargs
     
-    if _db_pool is not None:
-        return _db_pool
+    if _readonly_connect_kwargs is not None:
+        return _readonly_connect_kwargs
     
     db_config = get_db_config()
     ro_user = os.getenv("POSTGRES_RO_USER")
@@ -51,22 +67,45 @@ async def get_readonly_db_pool() -> asyncpg.Pool:
             missing.append("POSTGRES_RO_USER")
         raise ValueError(f"Missing database config: {', '.join(missing)}")
     
+    _readonly_connect_kwargs = {
+        "host": db_config.host,
+        "port": db_config.port,
+        "database": db_config.database,
+        "user": ro_user,
+        "password": ro_password,
+    }
+    return _readonly_connect_kwargs
+
+
+async def get_readonly_db_pool() -> asyncpg.Pool:
+    """
+    Get or create the async PostgreSQL connection pool (read-only user).
+    This pool is created on first call and reused for subsequent calls.
+    """
+    global _db_pool
+    
+    if _db_pool is not None:
+        return _db_pool
+    
+    connect_kwargs = _get_readonly_connect_kwargs()
+    
     try:
-        async def setup_connection(conn):
-            """Set up connection defaults."""
-            await conn.execute("SET statement_timeout = '60s'")
-        
         _db_pool = await asyncpg.create_pool(
-            host=db_config.host,
-            port=db_config.port,
-            database=db_config.database,
-            user=ro_user,
-            password=ro_password,
-            min_size=2,
-            max_size=10,
+            **connect_kwargs,
+            min_size=READONLY_POOL_MIN_SIZE,
+            max_size=READONLY_POOL_MAX_SIZE,
             command_timeout=60,
             max_inactive_connection_lifetime=300,
-            setup=setup_connection,
+            # Keep every command's prepared statements on warm connections
+            statement_cache_size=256,
+            max_cached_statement_lifetime=0,
+            # Sent in the startup packet, so no extra round trip per connection.
+            # Short interactive queries pay more for JIT compilation than they gain.
+            server_settings={
+                "statement_timeout": "60s",
+                "jit": "off",
+                "application_name": "discord_stats_bot",
+            },
         )
         logger.info("Created async database connection pool")
         return _db_pool
@@ -84,40 +123,19 @@ async def get_pathfinder_leaderboard_pool() -> asyncpg.Pool:
     if _pathfinder_pool is not None:
         return _pathfinder_pool
 
-    db_config = get_db_config()
-    ro_user = os.getenv("POSTGRES_RO_USER")
-    ro_password = os.getenv("POSTGRES_RO_PASSWORD")
-
-    if not all([db_config.host, db_config.port, db_config.database, ro_user]):
-        missing = []
-        if not db_config.host:
-            missing.append("POSTGRES_HOST")
-        if not db_config.port:
-            missing.append("POSTGRES_PORT")
-        if not db_config.database:
-            missing.append("POSTGRES_DB")
-        if not ro_user:
-            missing.append("POSTGRES_RO_USER")
-        raise ValueError(f"Missing database config: {', '.join(missing)}")
+    connect_kwargs = _get_readonly_connect_kwargs()
 
     try:
-        async def setup_connection(conn):
-            """Set up connection defaults."""
-            await conn.execute(
-                f"SET statement_timeout = '{PATHFINDER_LEADERBOARD_COMMAND_TIMEOUT}s'"
-            )
-
         _pathfinder_pool = await asyncpg.create_pool(
-            host=db_config.host,
-            port=db_config.port,
-            database=db_config.database,
-            user=ro_user,
-            password=ro_password,
+            **connect_kwargs,
             min_size=1,
             max_size=4,
             command_timeout=PATHFINDER_LEADERBOARD_COMMAND_TIMEOUT,
             max_inactive_connection_lifetime=300,
-            setup=setup_connection,
+            server_settings={
+                "statement_timeout": f"{PATHFINDER_LEADERBOARD_COMMAND_TIMEOUT}s",
+                "application_name": "discord_stats_bot_pathfinder",
+            },
         )
         logger.info(
             "Created pathfinder leaderboard pool (command_timeout=%ss)",
@@ -19,6 +19,21 @@ from apps.discord_stats_bot.common.logging import (
 
 logger = logging.getLogger(__name__)
 
+# Reply sent when a command is used outside the allowed channels
+CHANNEL_NOT_ALLOWED_ERROR = "❌ This bot can only be used in the designated channel."
+
+
+async def send_ephemeral_reply(
+    interaction: discord.Interaction,
+    content: str,
+    ephemeral: bool = True
+) -> None:
+    """Reply via the initial response if still available, otherwise via a followup."""
+    if not interaction.response.is_done():
+        await interaction.response.send_message(content, ephemeral=ephemeral)
+    else:
+        await interaction.followup.send(content, ephemeral=ephemeral)
+
 
 async def handle_command_errors(
     interaction: discord.Interaction,
@@ -46,10 +61,7 @@ async def handle_command_errors(
 
     log_command_completion(command_name, start_time, success=False, interaction=interaction, kwargs=kwargs)
 
-    if not interaction.response.is_done():
-        await interaction.response.send_message(error_msg, ephemeral=use_ephemeral)
-    else:
-        await interaction.followup.send(error_msg, ephemeral=use_ephemeral)
+    await send_ephemeral_reply(interaction, error_msg, ephemeral=use_ephemeral)
 
 
 def command_wrapper(
@@ -70,16 +82,13 @@ def command_wrapper(
         async def wrapper(interaction: discord.Interaction, *args, **kwargs):
             command_start_time = time.time()
 
-            log_kwargs = log_params or {}
-            log_kwargs.update(kwargs)
+            # kwargs is already a fresh dict per call; only merge when extra params exist
+            log_kwargs = {**log_params, **kwargs} if log_params else kwargs
             log_command_data(interaction, command_name, **log_kwargs)
 
             try:
                 if channel_check and not channel_check(interaction):
-                    await interaction.response.send_message(
-                        "❌ This bot can only be used in the designated channel.",
-                        ephemeral=True
-                    )
+                    await interaction.response.send_message(CHANNEL_NOT_ALLOWED_ERROR, ephemeral=True)
                     log_command_completion(
                         command_name, command_start_time, 
                         success=False, interaction=interaction, kwargs=log_kwargs
@@ -34,6 +34,14 @@ TIMEFRAME_OPTIONS = {
     "all": {"days": 0, "label": "All Time"},
 }
 
+# (value, label, description, emoji) for each timeframe dropdown option
+_TIMEFRAME_SELECT_OPTIONS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("1d", "Last 24 Hours", "View stats from the past day", "📅"),
+    ("7d", "Last 7 Days", "View stats from the past week", "📆"),
+    ("30d", "Last 30 Days", "View stats from the past month", "🗓️"),
+    ("all", "All Time", "View all-time stats", "♾️"),
+)
+
 
 def get_total_pages(results: List[Dict[str, Any]]) -> int:
     """Calculate total pages for results."""
@@ -42,6 +50,36 @@ def get_total_pages(results: List[Dict[str, Any]]) -> int:
     return max(1, (len(results) + PLAYERS_PER_PAGE - 1) // PLAYERS_PER_PAGE)
 
 
+def build_page_columns(
+    page_results: List[Dict[str, Any]],
+    first_rank: int,
+    value_key: str,
+    format_value: Callable[[Any], str]
+) -> Tuple[str, str, str]:
+    """
+    Build the Rank, Player and value column strings for one page in a single pass.
+    
+    Args:
+        page_results: Rows shown on this page
+        first_rank: Rank of the first row on the page
+        value_key: Key in result dict for the value column
+        format_value: Function to format values
+    
+    Returns:
+        Tuple of (ranks, players, values), each newline-joined
+    """
+    ranks = []
+    players = []
+    values = []
+    
+    for rank, row in enumerate(page_results, first_rank):
+        ranks.append(f"#{rank}")
+        players.append((row.get("player_name") or row.get("player_id", "Unknown"))[:20])  # Truncate long names
+        values.append(format_value(row.get(value_key, 0)))
+    
+    return "\n".join(ranks), "\n".join(players), "\n".join(values)
+
+
 def build_paginated_embed(
     title: str,
     results: List[Dict[str, Any]],
@@ -84,21 +122,11 @@ def build_paginated_embed(
     end_idx = start_idx + PLAYERS_PER_PAGE
     page_results = results[start_idx:end_idx]
     
-    ranks = []
-    players = []
-    values = []
-    
-    for rank, row in enumerate(page_results, start_idx + 1):
-        player_name = row.get("player_name") or row.get("player_id", "Unknown")
-        value = row.get(value_key, 0)
-        
-        ranks.append(f"#{rank}")
-        players.append(player_name[:20])  # Truncate long names
-        values.append(format_value(value))
+    ranks, players, values = build_page_columns(page_results, start_idx + 1, value_key, format_value)
     
-    embed.add_field(name="Rank", value="\n".join(ranks), inline=True)
-    embed.add_field(name="Player", value="\n".join(players), inline=True)
-    embed.add_field(name=value_label, value="\n".join(values), inline=True)
+    embed.add_field(name="Rank", value=ranks, inline=True)
+    embed.add_field(name="Player", value=players, inline=True)
+    embed.add_field(name=value_label, value=values, inline=True)
     
     # Build footer
     footer_parts = [f"Page {page}/{total_pages}"]
@@ -225,35 +253,16 @@ class LeaderboardTimeframeSelect(discord.ui.Select):
     """Dropdown select for choosing leaderboard timeframe."""
     
     def __init__(self, current_timeframe: str = "30d"):
+        # Options are built per view because their default flag is mutated in place
         options = [
             discord.SelectOption(
-                label="Last 24 Hours",
-                value="1d",
-                description="View stats from the past day",
-                emoji="📅",
-                default=(current_timeframe == "1d")
-            ),
-            discord.SelectOption(
-                label="Last 7 Days",
-                value="7d",
-                description="View stats from the past week",
-                emoji="📆",
-                default=(current_timeframe == "7d")
-            ),
-            discord.SelectOption(
-                label="Last 30 Days",
-                value="30d",
-                description="View stats from the past month",
-                emoji="🗓️",
-                default=(current_timeframe == "30d")
-            ),
-            discord.SelectOption(
-                label="All Time",
-                value="all",
-                description="View all-time stats",
-                emoji="♾️",
-                default=(current_timeframe == "all")
-            ),
+                label=label,
+                value=value,
+                description=description,
+                emoji=emoji,
+                default=(current_timeframe == value)
+            )
+            for value, label, description, emoji in _TIMEFRAME_SELECT_OPTIONS
         ]
         super().__init__(
             placeholder="Select a timeframe...",
@@ -270,6 +279,7 @@ class LeaderboardTimeframeSelect(discord.ui.Select):
         if new_timeframe != view.current_timeframe:
             view.current_timeframe = new_timeframe
             view.current_page = 1  # Reset to first page when changing timeframe
+            view._content_cache.clear()  # Cached pages belong to the previous timeframe
             
             # Fetch new data
             await interaction.response.defer(ephemeral=True)
@@ -344,9 +354,14 @@ class PaginatedLeaderboardView(discord.ui.View):
         self.updated_timestamp = datetime.now(timezone.utc)
         self.display_format = display_format
         
+        # Rendered pages for the current results, keyed by page; cleared whenever results are refetched
+        self._content_cache: Dict[int, Tuple[Optional[str], Optional[discord.Embed]]] = {}
+        
         # Add timeframe selector if fetch function provided
+        self._timeframe_select: Optional[LeaderboardTimeframeSelect] = None
         if fetch_data_func:
-            self.add_item(LeaderboardTimeframeSelect(current_timeframe))
+            self._timeframe_select = LeaderboardTimeframeSelect(current_timeframe)
+            self.add_item(self._timeframe_select)
     
     def _get_total_pages(self) -> int:
         """Get total pages for current results."""
@@ -413,18 +428,27 @@ class PaginatedLeaderboardView(discord.ui.View):
         """
         Build content based on display format.
         
+        Pages are rendered once per fetch and reused when the user navigates back to them.
+        
         Returns:
             Tuple of (content, embed) - one will be None depending on format
         """
+        cached = self._content_cache.get(self.current_page)
+        if cached is not None:
+            return cached
+        
         if self.display_format == "cards":
-            return None, self.build_embed()
+            built = None, self.build_embed()
         elif self.display_format == "table":
-            return self.build_table(), None
+            built = self.build_table(), None
         elif self.display_format == "list":
-            return self.build_list(), None
+            built = self.build_list(), None
         else:
             # Default to cards
-            return None, self.build_embed()
+            built = None, self.build_embed()
+        
+        self._content_cache[self.current_page] = built
+        return built
     
     async def update_message(self, interaction: discord.Interaction):
         """Update the message with current state."""
@@ -438,30 +462,19 @@ class PaginatedLeaderboardView(discord.ui.View):
     async def update_message_after_fetch(self, interaction: discord.Interaction):
         """Update the message after fetching new data (already deferred)."""
         self.updated_timestamp = datetime.now(timezone.utc)
+        self._content_cache.clear()
         
-        # Rebuild the view to update dropdown state
-        new_view = PaginatedLeaderboardView(
-            results=self.results,
-            title_template=self.title_template,
-            value_key=self.value_key,
-            value_label=self.value_label,
-            color=self.color,
-            format_value=self.format_value,
-            footer_extra=self.footer_extra,
-            current_timeframe=self.current_timeframe,
-            fetch_data_func=self.fetch_data_func,
-            show_timeframe_in_title=self.show_timeframe_in_title,
-            display_format=self.display_format
-        )
-        new_view.current_page = self.current_page
-        new_view.updated_timestamp = self.updated_timestamp
+        # Update dropdown state in place rather than rebuilding the view
+        if self._timeframe_select is not None:
+            for option in self._timeframe_select.options:
+                option.default = (option.value == self.current_timeframe)
         
-        content, embed = new_view.build_content()
+        content, embed = self.build_content()
         
         if self.display_format == "cards":
-            await interaction.edit_original_response(content=None, embed=embed, view=new_view)
+            await interaction.edit_original_response(content=None, embed=embed, view=self)
         else:
-            await interaction.edit_original_response(content=content, embed=None, view=new_view)
+            await interaction.edit_original_response(content=content, embed=None, view=self)
     
     @discord.ui.button(emoji="⏮️", style=discord.ButtonStyle.secondary, row=1)
     async def first_page(self, interaction: discord.Interaction, button: discord.ui.Button):
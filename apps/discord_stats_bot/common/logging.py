@@ -2,7 +2,10 @@
 Command logging utilities for Discord bot.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import time
 
 import discord
@@ -12,6 +15,32 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+def setup_queue_logging() -> logging.handlers.QueueListener:
+    """
+    Move root log handlers behind a queue so log emission happens off the event loop.
+    
+    The handlers currently attached to the root logger are handed to a
+    QueueListener thread, and the root logger gets a single QueueHandler,
+    so logger calls on the interaction path only enqueue the record.
+    Call after logging.basicConfig(); the listener is stopped at exit.
+    
+    Returns:
+        The started QueueListener
+    """
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 def log_command_data(interaction: discord.Interaction, command_name: str, **kwargs) -> None:
     """Log command invocation with user, channel, and parameters."""
     user = interaction.user
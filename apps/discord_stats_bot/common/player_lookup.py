@@ -7,13 +7,15 @@ Provides:
 - Pathfinder player ID management from S3
 """
 
+import asyncio
 import logging
 
 import asyncpg
 import boto3
 
+from cachetools import TTLCache
 from dataclasses import dataclass
-from typing import Optional, Set, Tuple
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
 
 from apps.discord_stats_bot.common.user_cache import get_player_id
 
@@ -31,6 +33,10 @@ PLAYER_NOT_SET_ERROR = (
 )
 
 
+class PoolBusyError(Exception):
+    """Raised when no database connection becomes free within the acquire timeout."""
+
+
 def player_not_found_error(player_input: str) -> str:
     """Generate error message for player not found."""
     return f"❌ Could not find user: `{player_input}`. Try using a player ID or exact player name."
@@ -125,6 +131,62 @@ async def lookup_player(
     
     return result, None
 
+
+# Cache of successful player lookups (stripped input -> (player_id, player_name)).
+# Only hits are cached so newly ingested players are found on the next try.
+PLAYER_LOOKUP_CACHE_MAXSIZE = 4096
+PLAYER_LOOKUP_CACHE_TTL_SECONDS = 300
+_player_lookup_cache: TTLCache[str, Tuple[str, str]] = TTLCache(
+    maxsize=PLAYER_LOOKUP_CACHE_MAXSIZE, ttl=PLAYER_LOOKUP_CACHE_TTL_SECONDS
+)
+
+# Resolve input as a player_id first, then as a player name, and return the
+# most recent name for the match in a single round trip. The name search only
+# runs when the ID check finds nothing.
+_FIND_PLAYER_QUERY = """
+    WITH id_match AS (
+        SELECT $1::text AS player_id
+        WHERE EXISTS (SELECT 1 FROM pathfinder_stats.player_match_stats WHERE player_id = $1)
+           OR EXISTS (SELECT 1 FROM pathfinder_stats.player_kill_stats WHERE player_id = $1)
+           OR EXISTS (SELECT 1 FROM pathfinder_stats.player_death_stats WHERE player_id = $1)
+    ),
+    name_match AS (
+        SELECT player_id
+        FROM (
+            SELECT player_id FROM pathfinder_stats.player_match_stats
+            WHERE player_name ILIKE $1 OR LOWER(player_name) = LOWER($1)
+            UNION
+            SELECT player_id FROM pathfinder_stats.player_kill_stats
+            WHERE player_name ILIKE $1 OR LOWER(player_name) = LOWER($1)
+            UNION
+            SELECT player_id FROM pathfinder_stats.player_death_stats
+            WHERE player_name ILIKE $1 OR LOWER(player_name) = LOWER($1)
+        ) combined_results
+        WHERE NOT EXISTS (SELECT 1 FROM id_match)
+        LIMIT 1
+    ),
+    resolved AS (
+        SELECT player_id FROM id_match
+        UNION ALL
+        SELECT player_id FROM name_match
+        LIMIT 1
+    )
+    SELECT
+        r.player_id,
+        (
+            SELECT pms.player_name
+            FROM pathfinder_stats.player_match_stats pms
+            INNER JOIN pathfinder_stats.match_history mh ON pms.match_id = mh.match_id
+            WHERE pms.player_id = r.player_id
+            ORDER BY mh.start_time DESC
+            LIMIT 1
+        ) AS player_name
+    FROM resolved r
+"""
+
+# In-flight lookups by stripped input, so concurrent identical lookups share one query
+_pending_player_lookups: Dict[str, "asyncio.Future[Optional[Tuple[Optional[str], Optional[str]]]]"] = {}
+
 # S3 configuration
 S3_BUCKET_NAME = "stats-let-loose"
 S3_KEY = "pathfinder_player_ids.txt"
@@ -134,73 +196,103 @@ _pathfinder_player_ids: Optional[Set[str]] = None
 _pathfinder_player_ids_initialized: bool = False
 
 
+PlayerIdAndName = Tuple[Optional[str], Optional[str]]
+
+
 async def find_player_by_id_or_name(
     conn: asyncpg.Connection, 
     player: str
-) -> Tuple[Optional[str], Optional[str]]:
+) -> PlayerIdAndName:
     """
     Look up a player by ID or name. 
     
+    Successful lookups are cached for PLAYER_LOOKUP_CACHE_TTL_SECONDS, and
+    concurrent lookups of the same input wait on a single in-flight query.
+    
     Returns:
         Tuple of (player_id, player_name) or (None, None) if not found.
     """
-    player = str(player).strip()
-    
-    # First, check if the input is a player_id
-    check_query = """
-        SELECT 1 FROM pathfinder_stats.player_match_stats WHERE player_id = $1
-        UNION ALL
-        SELECT 1 FROM pathfinder_stats.player_kill_stats WHERE player_id = $1
-        UNION ALL
-        SELECT 1 FROM pathfinder_stats.player_death_stats WHERE player_id = $1
-        LIMIT 1
+    return await _find_player_cached(
+        str(player).strip(),
+        lambda p: _query_player_by_id_or_name(conn, p)
+    )
+
+
+async def find_player_via_pool(
+    pool: asyncpg.Pool, 
+    player: str,
+    acquire_timeout: Optional[float] = None
+) -> PlayerIdAndName:
     """
-    player_exists = await conn.fetchval(check_query, player)
+    Look up a player by ID or name, acquiring a pool connection only on a cache miss.
     
-    if player_exists:
-        # Get most recent player name
-        name_query = """
-            SELECT DISTINCT ON (pms.player_id) pms.player_name
-            FROM pathfinder_stats.player_match_stats pms
-            INNER JOIN pathfinder_stats.match_history mh ON pms.match_id = mh.match_id
-            WHERE pms.player_id = $1
-            ORDER BY pms.player_id, mh.start_time DESC
-            LIMIT 1
-        """
-        found_player_name = await conn.fetchval(name_query, player)
-        return (player, found_player_name if found_player_name else player)
+    Args:
+        pool: Pool to acquire a connection from when the database must be queried
+        player: Player ID or name
+        acquire_timeout: Seconds to wait for a connection
     
-    # If no results from player_id, try player_name
-    find_player_query = """
-        SELECT DISTINCT player_id
-        FROM (
-            SELECT player_id FROM pathfinder_stats.player_match_stats
-            WHERE player_name ILIKE $1 OR LOWER(player_name) = LOWER($1)
-            UNION
-            SELECT player_id FROM pathfinder_stats.player_kill_stats
-            WHERE player_name ILIKE $1 OR LOWER(player_name) = LOWER($1)
-            UNION
-            SELECT player_id FROM pathfinder_stats.player_death_stats
-            WHERE player_name ILIKE $1 OR LOWER(player_name) = LOWER($1)
-        ) combined_results
-        LIMIT 1
+    Returns:
+        Tuple of (player_id, player_name) or (None, None) if not found.
+    
+    Raises:
+        PoolBusyError: If no connection could be acquired within acquire_timeout.
+            Query timeouts are not converted and propagate as asyncio.TimeoutError.
     """
-    found_player_id = await conn.fetchval(find_player_query, player)
+    async def query(p: str) -> PlayerIdAndName:
+        try:
+            conn = await pool.acquire(timeout=acquire_timeout)
+        except asyncio.TimeoutError as e:
+            raise PoolBusyError(f"No database connection available within {acquire_timeout}s") from e
+        try:
+            return await _query_player_by_id_or_name(conn, p)
+        finally:
+            await pool.release(conn)
     
-    if found_player_id:
-        # Get most recent player name
-        name_query = """
-            SELECT DISTINCT ON (pms.player_id) pms.player_name
-            FROM pathfinder_stats.player_match_stats pms
-            INNER JOIN pathfinder_stats.match_history mh ON pms.match_id = mh.match_id
-            WHERE pms.player_id = $1
-            ORDER BY pms.player_id, mh.start_time DESC
-            LIMIT 1
-        """
-        found_player_name = await conn.fetchval(name_query, found_player_id)
-        return (found_player_id, found_player_name if found_player_name else player)
+    return await _find_player_cached(str(player).strip(), query)
+
+
+async def _find_player_cached(
+    player: str,
+    query: Callable[[str], Awaitable[PlayerIdAndName]]
+) -> PlayerIdAndName:
+    """Serve a lookup from cache, an identical in-flight lookup, or query()."""
+    cached = _player_lookup_cache.get(player)
+    if cached is not None:
+        return cached
+    
+    pending = _pending_player_lookups.get(player)
+    if pending is not None:
+        shared_result = await asyncio.shield(pending)
+        if shared_result is not None:
+            return shared_result
+        # The in-flight lookup failed; run our own so its error surfaces here
+        return await query(player)
+    
+    future = asyncio.get_running_loop().create_future()
+    _pending_player_lookups[player] = future
+    result = None
+    try:
+        result = await query(player)
+        return result
+    finally:
+        del _pending_player_lookups[player]
+        future.set_result(result)
+
+
+async def _query_player_by_id_or_name(
+    conn: asyncpg.Connection, 
+    player: str
+) -> PlayerIdAndName:
+    """Query the database for a player by ID or name, caching successful lookups."""
+    row = await conn.fetchrow(_FIND_PLAYER_QUERY, player)
+    
+    if row is None:
+        return (None, None)
     
-    return (None, None)
+    found_player_name = row["player_name"]
+    result = (row["player_id"], found_player_name if found_player_name else player)
+    _player_lookup_cache[player] = result
+    return result
 
 
 async def load_pathfinder_player_ids_from_s3() -> None:
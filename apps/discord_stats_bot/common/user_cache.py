@@ -10,23 +10,76 @@ import asyncio
 import json
 import logging
 import os
-
-from cachetools import LRUCache
+import tempfile
+import threading
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - fall back to the standard json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path(os.getenv("DISCORD_BOT_CACHE_DIR", "/app/data/cache"))
 
+# Entry cap for each user cache; far above the number of users, so eviction is rare
+USER_CACHE_MAX_ENTRIES = 1000000
+
+
+def _set_capped(cache: Dict[int, str], key: int, value: str) -> None:
+    """
+    Store a value in a plain dict used as a size-capped cache.
+    
+    Updated keys move to the end, and the oldest entry is evicted once the
+    cap is exceeded, which approximates LRU without per-read bookkeeping.
+    """
+    cache.pop(key, None)
+    cache[key] = value
+    if len(cache) > USER_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+
+def _read_json(path: Path) -> dict:
+    """Read a JSON cache file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """
+    Write data as compact JSON to a temp file next to path, then atomically replace path.
+    
+    Each write uses its own uniquely named temp file, so concurrent writers can
+    never clobber each other's partial output before the rename.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
 # =============================================================================
 # Player ID Cache
 # =============================================================================
 
 _PLAYER_ID_CACHE_FILE = CACHE_DIR / "player_id_cache.json"
 _player_id_lock = asyncio.Lock()
-_player_id_cache: LRUCache[int, str] = LRUCache(maxsize=1000000)
+_player_id_cache: Dict[int, str] = {}
 _player_id_cache_initialized = False
 
 
@@ -40,14 +93,13 @@ async def _load_player_id_cache() -> None:
         return
     
     try:
-        with open(_PLAYER_ID_CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json(_PLAYER_ID_CACHE_FILE)
             
         async with _player_id_lock:
             _player_id_cache.clear()
             for user_id_str, player_id in data.items():
                 user_id = int(user_id_str)
-                _player_id_cache[user_id] = player_id
+                _set_capped(_player_id_cache, user_id, player_id)
         
         logger.info(f"Loaded {len(_player_id_cache)} player ID mappings from cache file")
         _player_id_cache_initialized = True
@@ -59,17 +111,11 @@ async def _load_player_id_cache() -> None:
 async def _save_player_id_cache(data: dict = None) -> None:
     """Persist player ID cache to disk atomically."""
     try:
-        _PLAYER_ID_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        
         if data is None:
             async with _player_id_lock:
                 data = {str(user_id): player_id for user_id, player_id in _player_id_cache.items()}
         
-        temp_file = _PLAYER_ID_CACHE_FILE.with_suffix('.json.tmp')
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        
-        temp_file.replace(_PLAYER_ID_CACHE_FILE)
+        _write_json_atomic(_PLAYER_ID_CACHE_FILE, data)
         logger.info(f"Saved {len(data)} player ID mappings")
     except IOError as e:
         logger.error(f"Failed to save player ID cache to {_PLAYER_ID_CACHE_FILE}: {e}", exc_info=True)
@@ -77,14 +123,14 @@ async def _save_player_id_cache(data: dict = None) -> None:
 
 async def get_player_id(discord_user_id: int) -> Optional[str]:
     """Get stored player ID for a Discord user, or None if not found."""
-    async with _player_id_lock:
-        return _player_id_cache.get(discord_user_id)
+    # A single synchronous get cannot interleave with writers, so no lock is needed
+    return _player_id_cache.get(discord_user_id)
 
 
 async def set_player_id(discord_user_id: int, player_id: str) -> None:
     """Store or update player ID for a Discord user."""
     async with _player_id_lock:
-        _player_id_cache[discord_user_id] = player_id
+        _set_capped(_player_id_cache, discord_user_id, player_id)
         data_to_save = {str(user_id): pid for user_id, pid in _player_id_cache.items()}
     await _save_player_id_cache(data_to_save)
 
@@ -116,9 +162,20 @@ async def initialize_cache() -> None:
 
 _FORMAT_CACHE_FILE = CACHE_DIR / "format_preference_cache.json"
 _format_lock = asyncio.Lock()
-_format_cache: LRUCache[int, str] = LRUCache(maxsize=1000000)
+_format_cache: Dict[int, str] = {}
 _format_cache_initialized = False
 
+# Preference changes only bump _format_cache_version; a background task writes the
+# cache out at most once per interval, and again on disconnect and at exit. The cache
+# is dirty while its version is ahead of the last version written to disk.
+FORMAT_CACHE_FLUSH_INTERVAL = float(os.getenv("FORMAT_CACHE_FLUSH_INTERVAL", "30"))
+_format_cache_version = 0
+_format_saved_version = 0
+_format_flush_lock = asyncio.Lock()
+# Serialises file writes across worker threads and the exit flush
+_format_write_lock = threading.Lock()
+_format_flush_task: Optional[asyncio.Task] = None
+
 # Valid format options
 VALID_FORMATS = {"cards", "table", "list"}
 DEFAULT_FORMAT = "cards"
@@ -141,15 +198,14 @@ async def _load_format_cache() -> None:
         return
     
     try:
-        with open(_FORMAT_CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json(_FORMAT_CACHE_FILE)
             
         async with _format_lock:
             _format_cache.clear()
             for user_id_str, format_pref in data.items():
                 user_id = int(user_id_str)
                 if format_pref in VALID_FORMATS:
-                    _format_cache[user_id] = format_pref
+                    _set_capped(_format_cache, user_id, format_pref)
         
         logger.info(f"Loaded {len(_format_cache)} format preferences from cache file")
         _format_cache_initialized = True
@@ -158,29 +214,93 @@ async def _load_format_cache() -> None:
         _format_cache_initialized = True
 
 
-async def _save_format_cache(data: dict = None) -> None:
-    """Persist format preference cache to disk atomically."""
+def _write_format_snapshot(data: dict, version: int) -> bool:
+    """
+    Write a format preference snapshot unless a newer one is already on disk.
+    
+    Runs in a worker thread or at exit. The saved version only advances after
+    a successful write, so a failed write leaves the cache dirty for a retry.
+    
+    Returns:
+        True if the snapshot was written, False if it was already superseded
+    """
+    global _format_saved_version
+    with _format_write_lock:
+        if version <= _format_saved_version:
+            return False
+        _write_json_atomic(_FORMAT_CACHE_FILE, data)
+        _format_saved_version = version
+        return True
+
+
+async def _save_format_cache() -> None:
+    """
+    Persist the current format preference cache to disk atomically.
+    
+    The JSON encoding and file write run in a worker thread so a large cache
+    does not stall the event loop.
+    """
+    async with _format_lock:
+        data = {str(user_id): format_pref for user_id, format_pref in _format_cache.items()}
+        version = _format_cache_version
+    
     try:
-        _FORMAT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        
-        if data is None:
-            async with _format_lock:
-                data = {str(user_id): format_pref for user_id, format_pref in _format_cache.items()}
-        
-        temp_file = _FORMAT_CACHE_FILE.with_suffix('.json.tmp')
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        
-        temp_file.replace(_FORMAT_CACHE_FILE)
-        logger.info(f"Saved {len(data)} format preferences")
+        if await asyncio.to_thread(_write_format_snapshot, data, version):
+            logger.info(f"Saved {len(data)} format preferences")
     except IOError as e:
         logger.error(f"Failed to save format cache to {_FORMAT_CACHE_FILE}: {e}", exc_info=True)
 
 
+async def flush_format_cache() -> None:
+    """Write the format preference cache to disk if it changed since the last flush."""
+    if _format_cache_version == _format_saved_version:
+        return
+    
+    # Held across the threaded write so flushes from the loop, on_disconnect and
+    # elsewhere never have two writer threads in flight at once
+    async with _format_flush_lock:
+        if _format_cache_version == _format_saved_version:
+            return
+        await _save_format_cache()
+
+
+async def _format_cache_flush_loop() -> None:
+    """Flush pending format preference changes every FORMAT_CACHE_FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(FORMAT_CACHE_FLUSH_INTERVAL)
+        try:
+            await flush_format_cache()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Keep the flusher alive; the changes stay pending for the next attempt
+            logger.error(f"Unexpected error flushing format cache: {e}", exc_info=True)
+
+
+def flush_format_cache_at_exit() -> None:
+    """
+    Synchronously write pending format preference changes during interpreter shutdown.
+    
+    Register with atexit after setup_queue_logging(), so this runs before the
+    log listener stops and its messages are still emitted.
+    """
+    version = _format_cache_version
+    if version == _format_saved_version:
+        return
+    
+    data = {str(user_id): fmt for user_id, fmt in _format_cache.items()}
+    try:
+        if _write_format_snapshot(data, version):
+            logger.info(f"Saved {len(data)} format preferences at exit")
+    except IOError as e:
+        logger.error(f"Failed to save format cache to {_FORMAT_CACHE_FILE} at exit: {e}")
+
+
+
 async def get_format_preference(discord_user_id: int) -> str:
     """Get stored format preference for a Discord user, or default if not found."""
-    async with _format_lock:
-        return _format_cache.get(discord_user_id, DEFAULT_FORMAT)
+    # A single synchronous get cannot interleave with writers, so no lock is needed
+    return _format_cache.get(discord_user_id, DEFAULT_FORMAT)
 
 
 async def set_format_preference(discord_user_id: int, format_pref: str) -> None:
@@ -188,28 +308,31 @@ async def set_format_preference(discord_user_id: int, format_pref: str) -> None:
     if format_pref not in VALID_FORMATS:
         raise ValueError(f"Invalid format: {format_pref}. Valid formats: {', '.join(VALID_FORMATS)}")
     
+    global _format_cache_version
     async with _format_lock:
-        _format_cache[discord_user_id] = format_pref
-        data_to_save = {str(user_id): fmt for user_id, fmt in _format_cache.items()}
-    await _save_format_cache(data_to_save)
+        _set_capped(_format_cache, discord_user_id, format_pref)
+        _format_cache_version += 1
 
 
 async def clear_format_preference(discord_user_id: int) -> None:
     """Remove stored format preference for a Discord user (resets to default)."""
-    should_save = False
+    global _format_cache_version
     async with _format_lock:
         if discord_user_id in _format_cache:
             del _format_cache[discord_user_id]
-            should_save = True
-            data_to_save = {str(user_id): fmt for user_id, fmt in _format_cache.items()}
+            _format_cache_version += 1
             logger.info(f"Cleared format preference for Discord user {discord_user_id}")
         else:
             logger.info(f"No format preference found for Discord user {discord_user_id}")
-    
-    if should_save:
-        await _save_format_cache(data_to_save)
 
 
 async def initialize_format_cache() -> None:
-    """Initialize the format preference cache by loading from disk. Should be called during bot startup."""
+    """
+    Initialize the format preference cache by loading from disk and start the background flusher.
+    Should be called during bot startup, from within the running event loop.
+    """
+    global _format_flush_task
     await _load_format_cache()
+    
+    if _format_flush_task is None or _format_flush_task.done():
+        _format_flush_task = asyncio.create_task(_format_cache_flush_loop())
@@ -33,7 +33,7 @@ def get_bot_instance() -> Optional[discord.Client]:
     return _bot_instance
 
 
-async def _is_message_protected(message: discord.Message, allowed_role_ids: set[int]) -> bool:
+async def _is_message_protected(message: discord.Message, allowed_role_ids: frozenset[int]) -> bool:
     """
     Check if a message should be protected from deletion.
     
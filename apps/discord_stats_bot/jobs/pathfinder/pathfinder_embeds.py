@@ -10,12 +10,20 @@ Contains functions to build:
 import discord
 
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List
 
 from apps.discord_stats_bot.common.constants import (
     PLAYERS_PER_PAGE,
     LEADERBOARD_STAT_CONFIGS,
 )
+from apps.discord_stats_bot.common.leaderboard_pagination import build_page_columns
+
+
+# Value formatters keyed by a stat config's value_format; anything else uses str()
+_VALUE_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "int": lambda value: f"{int(value):,}",
+    "float": lambda value: f"{float(value):.2f}",
+}
 
 
 def _get_total_pages(results: List[Dict[str, Any]]) -> int:
@@ -53,27 +61,13 @@ def _build_stat_embed_page(
     end_idx = start_idx + PLAYERS_PER_PAGE
     page_results = results[start_idx:end_idx]
     
-    ranks = []
-    players = []
-    values = []
+    ranks, players, values = build_page_columns(
+        page_results, start_idx + 1, "value", _VALUE_FORMATTERS.get(value_format, str)
+    )
     
-    for rank, row in enumerate(page_results, start_idx + 1):
-        player_name = row.get("player_name") or row.get("player_id", "Unknown")
-        value = row.get("value", 0)
-        
-        ranks.append(f"#{rank}")
-        players.append(player_name[:20])  # Truncate long names
-        
-        if value_format == "int":
-            values.append(f"{int(value):,}")
-        elif value_format == "float":
-            values.append(f"{float(value):.2f}")
-        else:
-            values.append(str(value))
-    
-    embed.add_field(name="Rank", value="\n".join(ranks), inline=True)
-    embed.add_field(name="Player", value="\n".join(players), inline=True)
-    embed.add_field(name=value_label, value="\n".join(values), inline=True)
+    embed.add_field(name="Rank", value=ranks, inline=True)
+    embed.add_field(name="Player", value=players, inline=True)
+    embed.add_field(name=value_label, value=values, inline=True)
     
     # Build footer: "Page 2/5 • Most Infantry Kills • Last 7 Days • Updated <timestamp>"
     stat_name = stat_config['title'].split(' ', 1)[1]  # Remove emoji
@@ -102,27 +96,13 @@ def _build_stat_embed(
     # Only show first page (25 players) for overview
     page_results = results[:PLAYERS_PER_PAGE]
     
-    ranks = []
-    players = []
-    values = []
-    
-    for rank, row in enumerate(page_results, 1):
-        player_name = row.get("player_name") or row.get("player_id", "Unknown")
-        value = row.get("value", 0)
-        
-        ranks.append(f"#{rank}")
-        players.append(player_name[:20])  # Truncate long names
-        
-        if value_format == "int":
-            values.append(f"{int(value):,}")
-        elif value_format == "float":
-            values.append(f"{float(value):.2f}")
-        else:
-            values.append(str(value))
+    ranks, players, values = build_page_columns(
+        page_results, 1, "value", _VALUE_FORMATTERS.get(value_format, str)
+    )
     
-    embed.add_field(name="Rank", value="\n".join(ranks), inline=True)
-    embed.add_field(name="Player", value="\n".join(players), inline=True)
-    embed.add_field(name=value_label, value="\n".join(values), inline=True)
+    embed.add_field(name="Rank", value=ranks, inline=True)
+    embed.add_field(name="Player", value=players, inline=True)
+    embed.add_field(name=value_label, value=values, inline=True)
     
     if footer_note:
         embed.set_footer(text=footer_note)
@@ -2,6 +2,7 @@
 Discord bot entry point with slash commands for player stats and leaderboards.
 """
 
+import atexit
 import logging
 import os
 import signal
@@ -20,8 +21,13 @@ from apps.discord_stats_bot.commands import (
 from apps.discord_stats_bot.common import (
     initialize_cache,
     initialize_format_cache,
+    flush_format_cache,
+    flush_format_cache_at_exit,
     log_command_data,
     log_command_completion,
+    setup_queue_logging,
+    send_ephemeral_reply,
+    CHANNEL_NOT_ALLOWED_ERROR,
     close_db_pool,
     get_weapon_names,
 )
@@ -38,6 +44,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+setup_queue_logging()
 logger = logging.getLogger(__name__)
 
 bot_config = get_bot_config()
@@ -69,18 +76,25 @@ def check_channel_permission(interaction: discord.Interaction) -> bool:
     return interaction.channel_id in ALLOWED_CHANNEL_IDS
 
 
+# Without an allow-list, pass no check so commands skip the per-interaction call
+command_channel_check = check_channel_permission if ALLOWED_CHANNEL_IDS else None
+
 # Register command groups
-setup_player_command(tree, check_channel_permission)
-setup_leaderboard_command(tree, check_channel_permission)
-setup_profile_command(tree, check_channel_permission)
+setup_player_command(tree, command_channel_check)
+setup_leaderboard_command(tree, command_channel_check)
+setup_profile_command(tree, command_channel_check)
 
 
 @bot.event
 async def setup_hook():
     """
     Called before the bot connects to Discord.
-    This is where we initialize required resources like loading player IDs from S3.
+    This is where we initialize required resources like the user caches and player IDs from S3.
     """
+    # Warm the user caches once, before any interaction can arrive
+    await initialize_cache()
+    await initialize_format_cache()
+    
     logger.info("Running setup hook: Loading pathfinder player IDs from S3...")
     try:
         await load_pathfinder_player_ids_from_s3()
@@ -99,10 +113,6 @@ async def on_ready():
     await bot.wait_until_ready()
     
     try:
-        # Initialize caches
-        await initialize_cache()
-        await initialize_format_cache()
-
         # Sync commands
         dev_guild_id = bot_config.dev_guild_id
         
@@ -169,9 +179,10 @@ async def on_ready():
 
 @bot.event
 async def on_disconnect():
-    """Clean up database connections on disconnect."""
+    """Clean up database connections and persist pending cache changes on disconnect."""
     logger.info("Bot disconnected, closing database pool...")
     _remove_readiness_file()
+    await flush_format_cache()
     await close_db_pool()
 
 
@@ -207,10 +218,7 @@ async def help_command(interaction: discord.Interaction):
     
     try:
         if not check_channel_permission(interaction):
-            await interaction.response.send_message(
-                "❌ This bot can only be used in the designated channel.",
-                ephemeral=True
-            )
+            await interaction.response.send_message(CHANNEL_NOT_ALLOWED_ERROR, ephemeral=True)
             log_command_completion("help", start_time, success=False, interaction=interaction, kwargs={})
             return
         
@@ -282,16 +290,9 @@ async def help_command(interaction: discord.Interaction):
     except Exception as e:
         logger.error(f"Error in help command: {e}", exc_info=True)
         log_command_completion("help", start_time, success=False, interaction=interaction, kwargs={})
-        if not interaction.response.is_done():
-            await interaction.response.send_message(
-                f"❌ An error occurred while loading help information: {str(e)}",
-                ephemeral=True
-            )
-        else:
-            await interaction.followup.send(
-                f"❌ An error occurred while loading help information: {str(e)}",
-                ephemeral=True
-            )
+        await send_ephemeral_reply(
+            interaction, f"❌ An error occurred while loading help information: {str(e)}"
+        )
 
 
 def _remove_readiness_file() -> None:
@@ -304,6 +305,10 @@ def _remove_readiness_file() -> None:
 
 def main():
     """Main entry point for the Discord bot."""
+    # atexit runs handlers in reverse order, so registering after setup_queue_logging()
+    # makes the final cache write run while the log listener is still running
+    atexit.register(flush_format_cache_at_exit)
+    
     def handle_shutdown_signal(signum: int, frame) -> None:
         logger.info("Received signal %s, removing readiness file and exiting.", signum)
         _remove_readiness_file()